@@ -25,7 +25,7 @@ class _SubagentRunner:
                 async with self._semaphore:
                     async with self._subagent:
                         async for event in self._subagent.stream(prompt, max_turns=max_turns):
-                            await queue.put(event)
+                            queue.put_nowait(event)
             except Exception as e:
                 queue.put_nowait(e)
             finally:
@@ -1,6 +1,7 @@
 import json
 from dataclasses import dataclass
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -16,8 +17,13 @@ def _path_matches(path: str, pattern: str) -> bool:
     return PurePosixPath(path).full_match(pattern)  # type: ignore[attr-defined]
 
 
+@lru_cache(maxsize=256)
 def _normalize_path(path_str: str, working_dir: Path) -> str:
-    """Normalize a path: if absolute and under working_dir, make relative."""
+    """Normalize a path: if absolute and under working_dir, make relative.
+
+    Memoized because a file tool call is matched against every path rule of
+    the permission lists, always with the same path and working directory.
+    """
     p = Path(path_str)
     if p.is_absolute():
         try:
@@ -27,7 +33,7 @@ def _normalize_path(path_str: str, working_dir: Path) -> str:
     return path_str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCall:
     """Base class for typed tool call representations."""
 
@@ -103,7 +109,7 @@ class ToolCall:
         return False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GenericCall(ToolCall):
     """Fallback for tool calls without specialized handling."""
 
@@ -119,7 +125,7 @@ class GenericCall(ToolCall):
         return fnmatch(self.tool_name, entry.get("tool_name", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShellAction(ToolCall):
     """Shell command extracted from a code cell."""
 
@@ -148,7 +154,7 @@ class ShellAction(ToolCall):
         return fnmatch(self.tool_name, entry.get("tool_name", "")) and fnmatch(self.command, entry.get("command", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeAction(ToolCall):
     """Code execution action."""
 
@@ -166,7 +172,7 @@ class CodeAction(ToolCall):
         return fnmatch(self.tool_name, entry.get("tool_name", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileRead(ToolCall):
     """File read action."""
 
@@ -198,7 +204,7 @@ class FileRead(ToolCall):
         return _path_matches(normalized, entry_pattern)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileWrite(ToolCall):
     """File write action."""
 
@@ -226,7 +232,7 @@ class FileWrite(ToolCall):
         return _path_matches(normalized, entry.get("path", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEdit(ToolCall):
     """File edit action."""
 
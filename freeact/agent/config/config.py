@@ -11,6 +11,7 @@ from freeact.agent.config.runtime import (
     resolve_kernel_env,
     resolve_mcp_servers,
     resolve_model_instance,
+    resolve_model_settings,
     validate_ptc_servers,
 )
 from freeact.agent.config.skills import SkillMetadata, load_skills_metadata, materialize_bundled_skills
@@ -24,6 +25,17 @@ DEFAULT_MODEL_SETTINGS: dict[str, Any] = {
     }
 }
 
+# Prompt caching breakpoints applied to Anthropic models unless overridden in
+# `model_settings`. Tool definitions and the system prompt are identical across
+# requests of a session, so they are sent as a cached prefix. The breakpoint on
+# the last message moves forward with every request, so the next request reads
+# the conversation history up to that point from cache.
+ANTHROPIC_CACHE_SETTINGS: dict[str, Any] = {
+    "anthropic_cache_tool_definitions": True,
+    "anthropic_cache_instructions": True,
+    "anthropic_cache_messages": True,
+}
+
 FILESYSTEM_MCP_SERVER_CONFIG: dict[str, Any] = {
     "command": "python",
     "args": ["-m", "freeact.tools.filesystem"],
@@ -105,6 +117,7 @@ class Config(PersistentConfig):
     )
 
     _resolved_model_instance: str | Model = PrivateAttr(default="")
+    _resolved_model_settings: dict[str, Any] = PrivateAttr(default_factory=dict)
     _resolved_mcp_servers: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
     _resolved_kernel_env: dict[str, str] = PrivateAttr(default_factory=dict)
     _subagent_mode: bool = PrivateAttr(default=False)
@@ -121,6 +134,15 @@ class Config(PersistentConfig):
                 resolution_env=resolution_env,
             ),
         )
+        object.__setattr__(
+            self,
+            "_resolved_model_settings",
+            resolve_model_settings(
+                model=self._resolved_model_instance,
+                model_settings=self.model_settings,
+                anthropic_cache_settings=ANTHROPIC_CACHE_SETTINGS,
+            ),
+        )
         object.__setattr__(
             self,
             "_resolved_mcp_servers",
@@ -187,6 +209,10 @@ class Config(PersistentConfig):
     def model_instance(self) -> str | Model:
         return self._resolved_model_instance
 
+    @property
+    def resolved_model_settings(self) -> dict[str, Any]:
+        return copy.deepcopy(self._resolved_model_settings)
+
     @property
     def resolved_kernel_env(self) -> dict[str, str]:
         return dict(self._resolved_kernel_env)
@@ -216,7 +242,16 @@ class Config(PersistentConfig):
         )
 
     def for_subagent(self) -> "Config":
-        config = self.model_copy(update={"enable_subagents": False}, deep=True)
+        config = self.model_copy(
+            update={
+                "enable_subagents": False,
+                "model_settings": copy.deepcopy(self.model_settings),
+                "kernel_env": dict(self.kernel_env),
+                "mcp_servers": copy.deepcopy(self.mcp_servers),
+                "ptc_servers": copy.deepcopy(self.ptc_servers),
+                "provider_settings": copy.deepcopy(self.provider_settings),
+            }
+        )
         object.__setattr__(config, "_subagent_mode", True)
         return config
 
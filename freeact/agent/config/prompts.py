@@ -1,3 +1,4 @@
+from functools import cache
 from importlib.resources import as_file, files
 from pathlib import Path
 
@@ -11,9 +12,7 @@ def load_system_prompt(
     project_instructions_file: Path,
     skills_metadata: list[SkillMetadata],
 ) -> str:
-    prompts = files("freeact.agent.config").joinpath("prompts")
-    with as_file(prompts) as prompts_dir:
-        template = (prompts_dir / "system.md").read_text()
+    template = _load_template("system.md")
 
     return template.format(
         working_dir=working_dir,
@@ -30,10 +29,16 @@ def _render_section(section_name: str, content: str | None) -> str:
     if content is None:
         return ""
 
+    template = _load_template(f"section-{section_name}.md")
+    return template.format(content=content)
+
+
+@cache
+def _load_template(name: str) -> str:
+    # Bundled templates are package data and do not change at runtime.
     prompts = files("freeact.agent.config").joinpath("prompts")
     with as_file(prompts) as prompts_dir:
-        template = (prompts_dir / f"section-{section_name}.md").read_text()
-    return template.format(content=content)
+        return (prompts_dir / name).read_text()
 
 
 def _load_project_instructions_content(project_instructions_file: Path) -> str | None:
@@ -35,6 +35,34 @@ def resolve_model_instance(
     return infer_model(model, provider_factory=provider_factory)
 
 
+def resolve_model_settings(
+    *,
+    model: str | Model,
+    model_settings: dict[str, Any],
+    anthropic_cache_settings: dict[str, Any],
+) -> dict[str, Any]:
+    if not _is_anthropic_model(model):
+        return model_settings
+
+    defaults = dict(anthropic_cache_settings)
+    if model_settings.get("anthropic_cache"):
+        # pydantic-ai rejects automatic caching combined with a message breakpoint.
+        defaults.pop("anthropic_cache_messages", None)
+
+    return {
+        **defaults,
+        **model_settings,
+    }
+
+
+def _is_anthropic_model(model: str | Model) -> bool:
+    match model:
+        case Model():
+            return model.system == "anthropic"
+        case _:
+            return model.partition(":")[0] == "anthropic"
+
+
 def resolve_kernel_env(
     *,
     kernel_env: dict[str, str],
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from importlib.resources import as_file, files
 from pathlib import Path
 
@@ -68,15 +69,22 @@ def _scan_skills_dir(skills_dir: Path) -> list[SkillMetadata]:
 
 
 def _parse_skill_file(skill_file: Path) -> SkillMetadata | None:
+    # Keyed on a single stat() result so that edited or replaced skill files are re-parsed
+    stat = skill_file.stat()
+    return _parse_skill_file_cached(skill_file, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+@lru_cache(maxsize=256)
+def _parse_skill_file_cached(skill_file: Path, mtime_ns: int, size: int, ino: int) -> SkillMetadata | None:
     content = skill_file.read_text()
     if not content.startswith("---"):
         return None
 
-    parts = content.split("---", 2)
-    if len(parts) < 3:
+    end = content.find("---", 3)
+    if end == -1:
         return None
 
-    frontmatter = yaml.safe_load(parts[1])
+    frontmatter = yaml.safe_load(content[3:end])
     if not isinstance(frontmatter, dict):
         return None
 
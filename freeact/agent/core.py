@@ -25,11 +25,12 @@ from pydantic_ai.messages import (
     ThinkingPart,
     ThinkingPartDelta,
     ToolCallPart,
+    ToolCallPartDelta,
     ToolReturnPart,
     UserContent,
     UserPromptPart,
 )
-from pydantic_ai.models import ModelRequestParameters
+from pydantic_ai.models import ModelRequestParameters, infer_model
 from pydantic_ai.tools import ToolDefinition
 
 from freeact.agent._subagent import _SubagentRunner
@@ -123,9 +124,9 @@ class Agent:
 
         self.agent_id = agent_id or "main"
         self.model = config.model_instance
-        self.model_settings = config.model_settings
+        self.model_settings = config.resolved_model_settings
 
-        self._system_prompt = config.system_prompt
+        self._system_prompt: str | None = None
         self._execution_timeout = config.execution_timeout
         self._enable_subagents = config.enable_subagents
         self._sandbox = sandbox
@@ -151,6 +152,8 @@ class Agent:
 
         self._tool_mapping: dict[str, MCPServer] = {}
         self._tool_definitions: list[ToolDefinition] = []
+        self._tool_name_set: frozenset[str] = frozenset()
+        self._request_params = ModelRequestParameters()
 
         self._kernel_env = config.resolved_kernel_env
 
@@ -170,6 +173,8 @@ class Agent:
 
         self._cancel_event = asyncio.Event()
         self._message_history: list[ModelMessage] = []
+        self._pending_history_write: asyncio.Future[None] | None = None
+        self._pending_history_count = 0
         self._resource_supervisors: list[_ResourceSupervisor] = []
         self._subagent_semaphore = asyncio.Semaphore(config.max_subagents)
 
@@ -247,8 +252,20 @@ class Agent:
             if self._enable_subagents:
                 self._tool_definitions.extend(await load_subagent_task_tool_definitions())
 
-            for server in self._mcp_server_instances.values():
-                for tool_def in await get_tool_definitions(server):
+            servers = list(self._mcp_server_instances.values())
+            # A task group cancels the remaining listings when one fails, so
+            # none of them still runs when the servers are stopped below.
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    listings = [tg.create_task(get_tool_definitions(server)) for server in servers]
+            except ExceptionGroup as eg:
+                # Surface the first listing error itself rather than the group,
+                # the others are only logged.
+                for exc in eg.exceptions[1:]:
+                    logger.error("Failed to list MCP server tools", exc_info=exc)
+                raise eg.exceptions[0] from None
+            for server, listing in zip(servers, listings):
+                for tool_def in listing.result():
                     self._tool_definitions.append(tool_def)
                     self._tool_mapping[tool_def.name] = server
         except Exception:
@@ -257,13 +274,23 @@ class Agent:
             await self.stop()
             raise
 
+        self._tool_name_set = frozenset(tool_def.name for tool_def in self._tool_definitions)
+        self._request_params = ModelRequestParameters(function_tools=self._tool_definitions)
+
     async def stop(self) -> None:
         """Stop the code executor and MCP servers.
 
         Automatically called when exiting the async context manager.
         """
+        try:
+            await self._await_pending_history_write()
+        except Exception:
+            logger.exception("Failed to persist message history")
+
         self._tool_definitions = []
         self._tool_mapping = {}
+        self._tool_name_set = frozenset()
+        self._request_params = ModelRequestParameters()
 
         resource_supervisors = self._resource_supervisors
         self._resource_supervisors = []
@@ -306,10 +333,13 @@ class Agent:
 
         return servers
 
-    def _create_model_request(self, user_prompt: str | Sequence[UserContent]) -> ModelRequest:
+    async def _create_model_request(self, user_prompt: str | Sequence[UserContent]) -> ModelRequest:
         parts: list[SystemPromptPart | UserPromptPart] = []
 
         if not self._message_history:
+            if self._system_prompt is None:
+                # Rendered on first use only, resumed sessions already have it in history.
+                self._system_prompt = await arun(lambda: self._config.system_prompt)
             parts.append(SystemPromptPart(content=self._system_prompt))
         parts.append(UserPromptPart(content=user_prompt))
 
@@ -345,6 +375,10 @@ class Agent:
             async for event in self._stream_turn(prompt, max_turns):
                 yield event
         except Exception:
+            try:
+                await self._await_pending_history_write()
+            except Exception:
+                logger.exception("Failed to persist message history")
             rollback_count = len(self._message_history) - turn_history_start
             if rollback_count > 0:
                 try:
@@ -358,10 +392,15 @@ class Agent:
         prompt: str | Sequence[UserContent],
         max_turns: int | None,
     ) -> AsyncIterator[AgentEvent]:
-        request = self._create_model_request(prompt)
-        request_params = ModelRequestParameters(function_tools=self._tool_definitions)
+        if isinstance(self.model, str):
+            # Model requests would otherwise infer a new model (with a new
+            # provider and SDK client) from the model name on every call.
+            self.model = infer_model(self.model)
 
-        await self._append_message_history([request])
+        request = await self._create_model_request(prompt)
+
+        # Persisting the request overlaps with the first model request.
+        await self._append_message_history([request], background=True)
 
         turn = 0
 
@@ -377,27 +416,35 @@ class Agent:
                 self.model,
                 self._message_history,
                 model_settings=self.model_settings,
-                model_request_parameters=request_params,
+                model_request_parameters=self._request_params,
             ) as event_stream:
                 async for event in event_stream:
+                    # Deltas make up nearly all stream events, so they are matched first.
+                    # Tool call argument deltas (streamed code actions) are skipped right
+                    # away, complete tool calls are read from the aggregated response.
                     match event:
+                        case PartDeltaEvent(delta=ToolCallPartDelta()):
+                            pass
+                        case PartDeltaEvent(delta=TextPartDelta(content_delta=delta)) if delta:
+                            response_parts.append(delta)
+                            yield ResponseChunk(content=delta, agent_id=self.agent_id)
+                        case PartDeltaEvent(delta=ThinkingPartDelta(content_delta=delta)) if delta:
+                            thinking_parts.append(delta)
+                            yield ThoughtsChunk(content=delta, agent_id=self.agent_id)
                         case PartStartEvent(part=ThinkingPart(content=content)) if content:
                             thinking_parts.append(content)
                             yield ThoughtsChunk(content=content, agent_id=self.agent_id)
                         case PartStartEvent(part=TextPart(content=content)) if content:
                             response_parts.append(content)
                             yield ResponseChunk(content=content, agent_id=self.agent_id)
-                        case PartDeltaEvent(delta=ThinkingPartDelta(content_delta=delta)) if delta:
-                            thinking_parts.append(delta)
-                            yield ThoughtsChunk(content=delta, agent_id=self.agent_id)
-                        case PartDeltaEvent(delta=TextPartDelta(content_delta=delta)) if delta:
-                            response_parts.append(delta)
-                            yield ResponseChunk(content=delta, agent_id=self.agent_id)
                     if self._cancel_event.is_set():
                         break
 
                 aggregated = event_stream.get()
 
+            # `tool_calls` is a property that filters `parts` on every access.
+            tool_calls = aggregated.tool_calls
+
             thoughts = "".join(thinking_parts) if thinking_parts else None
             response = "".join(response_parts)
 
@@ -410,36 +457,38 @@ class Agent:
                 yield Response(content=response, agent_id=self.agent_id)
 
             if self._cancel_event.is_set():
-                if aggregated.tool_calls:
-                    synthetic_returns = [self._interrupted_tool_return(c) for c in aggregated.tool_calls]
+                if tool_calls:
+                    synthetic_returns = [self._interrupted_tool_return(c) for c in tool_calls]
                     await self._append_message_history([ModelRequest(parts=synthetic_returns)])
                 yield Cancelled(agent_id=self.agent_id, phase="llm_streaming")
                 return
 
-            if not aggregated.tool_calls:
+            if not tool_calls:
                 return
 
             tool_returns: list[ToolReturnPart] = []
             media_parts: list[UserPromptPart] = []
-            tool_streams = [self._execute_tool(call) for call in aggregated.tool_calls]
+            tool_streams = [self._execute_tool(call) for call in tool_calls]
 
             merged = merge(*tool_streams)
 
             async with merged.stream() as streamer:
                 async for item in streamer:
+                    # Events (e.g. streamed execution output) are the common case, the
+                    # tool return and media parts arrive once per tool call.
                     match item:
+                        case AgentEvent():
+                            yield item
                         case ToolReturnPart():
                             tool_returns.append(item)
                         case UserPromptPart():
                             media_parts.append(item)
-                        case _:
-                            yield item
                     if self._cancel_event.is_set():
                         break
 
             # Synthetic returns for tools that didn't complete
             returned_ids = {tr.tool_call_id for tr in tool_returns}
-            for call in aggregated.tool_calls:
+            for call in tool_calls:
                 if call.tool_call_id not in returned_ids:
                     tool_returns.append(self._interrupted_tool_return(call))
 
@@ -498,7 +547,7 @@ class Agent:
         tool_args = call.args_as_dict()
         corr_id = uuid.uuid4().hex[:8]
 
-        if tool_name not in self.tool_names:
+        if tool_name not in self._tool_name_set:
             yield ToolReturnPart(
                 tool_call_id=call.tool_call_id,
                 tool_name=tool_name,
@@ -599,6 +648,9 @@ class Agent:
             session_id=self._session_id,
         )
         subagent._cancel_event = self._cancel_event
+        # Subagent config differs only in flags the system prompt does not depend on.
+        subagent._system_prompt = self._system_prompt
+        subagent.model = self.model
         runner = _SubagentRunner(subagent=subagent, semaphore=self._subagent_semaphore)
 
         async def _cancel_monitor() -> None:
@@ -725,17 +777,42 @@ class Agent:
         except Exception as e:
             return f"MCP tool call failed: {str(e)}"
 
-    async def _append_message_history(self, messages: list[ModelMessage]) -> None:
+    async def _append_message_history(self, messages: list[ModelMessage], background: bool = False) -> None:
         if not messages:
             return
 
+        if self._session_store is None:
+            self._message_history.extend(messages)
+            return
+
+        # Writes are ordered: a pending background write must complete
+        # before later messages are added.
+        await self._await_pending_history_write()
         self._message_history.extend(messages)
-        if self._session_store is not None:
-            await arun(
-                self._session_store.append_messages,
-                agent_id=self._history_agent_id,
-                messages=messages,
-            )
+        write = arun(
+            self._session_store.append_messages,
+            agent_id=self._history_agent_id,
+            messages=messages,
+        )
+        if background:
+            self._pending_history_write = asyncio.ensure_future(write)
+            self._pending_history_count = len(messages)
+        else:
+            await write
+
+    async def _await_pending_history_write(self) -> None:
+        write = self._pending_history_write
+        if write is None:
+            return
+        self._pending_history_write = None
+        try:
+            await write
+        except Exception:
+            # Nothing is appended while a write is pending, so the unpersisted
+            # messages are the last ones in memory. Dropping them keeps memory
+            # and store aligned for later rollbacks.
+            del self._message_history[-self._pending_history_count :]
+            raise
 
     async def _rollback_message_history(self, count: int) -> None:
         if count <= 0:
@@ -743,6 +820,8 @@ class Agent:
         if count > len(self._message_history):
             raise ValueError(f"Cannot rollback {count} messages from history of size {len(self._message_history)}")
 
+        # Callers await the pending history write before computing `count`,
+        # because a failed write drops its messages from memory.
         del self._message_history[-count:]
         if self._session_store is not None:
             await arun(
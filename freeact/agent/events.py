@@ -8,7 +8,7 @@ from pydantic_ai.mcp import ToolResult
 from freeact.agent.call import ToolCall
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class AgentEvent:
     """Base class for all agent stream events.
 
@@ -21,49 +21,49 @@ class AgentEvent:
     parent_corr_id: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResponseChunk(AgentEvent):
     """Partial model response text (content streaming)."""
 
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Response(AgentEvent):
     """Complete model response at a given step."""
 
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThoughtsChunk(AgentEvent):
     """Partial model thinking text (content streaming)."""
 
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Thoughts(AgentEvent):
     """Complete model thoughts at a given step."""
 
     content: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolOutput(AgentEvent):
     """JSON tool call or built-in operation output."""
 
     content: ToolResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeExecutionOutputChunk(AgentEvent):
     """Partial code execution output (content streaming)."""
 
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeExecutionOutput(AgentEvent):
     """Complete code execution output."""
 
@@ -88,7 +88,7 @@ class CodeExecutionOutput(AgentEvent):
         return "\n".join(parts) if parts else ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ApprovalRequest(AgentEvent):
     """Pending code action or tool call awaiting user approval.
 
@@ -117,7 +117,7 @@ class ApprovalRequest(AgentEvent):
         return await self._future
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class Cancelled(AgentEvent):
     """Agent execution was cancelled by the user."""
 
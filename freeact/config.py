@@ -4,6 +4,7 @@ from typing import Any, ClassVar, Self
 
 from ipybox.utils import arun
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import from_json
 
 FREEACT_DIR_NAME = ".freeact"
 
@@ -28,7 +29,13 @@ class PersistentConfig(BaseModel):
 
     @property
     def _config_file(self) -> Path:
-        return self.freeact_dir / self._config_filename
+        return self._config_file_path(self.working_dir)
+
+    @classmethod
+    def _config_file_path(cls, working_dir: Path) -> Path:
+        # Derived without constructing an instance, since construction may
+        # resolve expensive subclass state (e.g. model instances).
+        return working_dir / FREEACT_DIR_NAME / cls._config_filename
 
     async def save(self) -> None:
         """Persist config to the `.freeact/` directory."""
@@ -37,29 +44,46 @@ class PersistentConfig(BaseModel):
     @classmethod
     async def load(cls, working_dir: Path | None = None) -> Self:
         """Load persisted config if present, otherwise return defaults."""
-        config = cls(working_dir=working_dir or Path.cwd())
-        config_file = config._config_file
-        if not config_file.exists():
+        working_dir = (working_dir or Path.cwd()).resolve()
+        config = await cls._load_file(working_dir)
+        if config is not None:
             return config
-
-        data = await arun(lambda: json.loads(config_file.read_text()))
-        return cls.model_validate(
-            {
-                **data,
-                "working_dir": config.working_dir,
-            }
-        )
+        return cls(working_dir=working_dir)
 
     @classmethod
     async def init(cls, working_dir: Path | None = None) -> Self:
         """Load config when present, otherwise save defaults."""
-        config = cls(working_dir=working_dir or Path.cwd())
-        if config._config_file.exists():
-            return await cls.load(working_dir=config.working_dir)
+        working_dir = (working_dir or Path.cwd()).resolve()
+        config = await cls._load_file(working_dir)
+        if config is not None:
+            return config
 
+        config = cls(working_dir=working_dir)
         await config.save()
         return config
 
+    @classmethod
+    async def _load_file(cls, working_dir: Path) -> Self | None:
+        return await arun(cls._load_file_sync, working_dir)
+
+    @classmethod
+    def _load_file_sync(cls, working_dir: Path) -> Self | None:
+        # Handles a missing file on read instead of checking existence first,
+        # which saves a stat call when the file is present. Only the read is
+        # guarded, errors raised during validation must not look like a
+        # missing file.
+        try:
+            content = cls._config_file_path(working_dir).read_bytes()
+        except FileNotFoundError:
+            return None
+        data = from_json(content)
+        return cls.model_validate(
+            {
+                **data,
+                "working_dir": working_dir,
+            }
+        )
+
     def _save_sync(self) -> None:
         self.freeact_dir.mkdir(parents=True, exist_ok=True)
         payload = self.model_dump(mode="json", exclude={"working_dir"})
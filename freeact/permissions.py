@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 from typing import Any
 
@@ -117,7 +116,8 @@ class PermissionsConfig(BaseModel):
     @classmethod
     def with_defaults(cls) -> "PermissionsConfig":
         """Create an instance with default ask and allow rules."""
-        return cls(
+        # The default rules are trusted module constants, skip re-validating them.
+        return cls.model_construct(
             ask=[rule.copy() for rule in DEFAULT_ASK_RULES],
             allow=[rule.copy() for rule in DEFAULT_ALLOW_RULES],
         )
@@ -167,16 +167,14 @@ class PermissionManager:
         if not self._permissions_file.exists():
             return
 
-        text = self._permissions_file.read_text()
-        data = json.loads(text)
-
-        self._always = PermissionsConfig.model_validate(data)
+        self._always = PermissionsConfig.model_validate_json(self._permissions_file.read_bytes())
 
     def save(self) -> None:
         """Persist always-tier permissions to `.freeact/permissions.json`."""
         self._freeact_dir.mkdir(parents=True, exist_ok=True)
-        content = json.dumps(self._always.model_dump(), indent=2)
-        self._permissions_file.write_text(content)
+        # `model_dump_json` keeps non-ASCII characters, write them as UTF-8
+        # regardless of the locale so that `load` can decode them again.
+        self._permissions_file.write_bytes(self._always.model_dump_json(indent=2).encode())
 
     def is_allowed(self, tool_call: ToolCall) -> bool:
         """Check if a concrete tool call is pre-approved.
@@ -2,10 +2,12 @@ import asyncio
 import re
 from collections.abc import AsyncIterator, Callable
 from dataclasses import dataclass, field
+from functools import cache
 from importlib.metadata import PackageNotFoundError
 from importlib.metadata import version as package_version
 from pathlib import Path
 from typing import TypeAlias
+from weakref import WeakKeyDictionary, WeakSet
 
 from ipybox.utils import arun
 from rich.console import Console
@@ -70,9 +72,10 @@ from freeact.terminal.widgets import (
 AgentStreamFn: TypeAlias = Callable[[str], AsyncIterator[AgentEvent]]
 Location: TypeAlias = tuple[int, int]
 _BANNER_PATH = Path(__file__).with_name("banner.txt")
+_SLASH_COMMAND_PATTERN = re.compile(r"^/(\S+)([\s\S]*)")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SlashCommandContext:
     """Cursor range that covers the `/command` token in the prompt."""
 
@@ -80,7 +83,7 @@ class SlashCommandContext:
     end: Location
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolCallBoxState:
     """Mounted container state for a tool-call widget with nested trace container."""
 
@@ -98,6 +101,8 @@ class ExecOutputState:
 
     box: Collapsible
     log: RichLog
+    pending: list[str] = field(default_factory=list)
+    flush_scheduled: bool = False
 
 
 @dataclass
@@ -105,56 +110,58 @@ class TurnRenderState:
     """Mutable render state for one in-flight conversation turn."""
 
     thoughts_stream: "Markdown.MarkdownStream | None" = None
+    thoughts_box: Collapsible | None = None
     response_stream: "Markdown.MarkdownStream | None" = None
     exec_logs: dict[ExecLogKey, ExecOutputState] = field(default_factory=dict)
 
 
 @dataclass
 class CollapseState:
-    """Collapse policy state shared across tracked `Collapsible` widgets."""
+    """Collapse policy state shared across tracked `Collapsible` widgets.
+
+    State is keyed by weak references to the widgets, so entries are dropped
+    when a widget is garbage collected and never outlive it.
+    """
 
     schedule_scroll: Callable[[], None]
     expand_all_override: bool = False
-    configured_collapsed: dict[int, bool] = field(default_factory=dict)
-    manual_collapsed: dict[int, bool] = field(default_factory=dict)
-    forced_expanded_ids: set[int] = field(default_factory=set)
-    suppressed_toggle_events: dict[int, int] = field(default_factory=dict)
+    configured_collapsed: WeakKeyDictionary[Collapsible, bool] = field(default_factory=WeakKeyDictionary)
+    manual_collapsed: WeakKeyDictionary[Collapsible, bool] = field(default_factory=WeakKeyDictionary)
+    forced_expanded: WeakSet[Collapsible] = field(default_factory=WeakSet)
+    suppressed_toggle_events: WeakKeyDictionary[Collapsible, int] = field(default_factory=WeakKeyDictionary)
 
     def register(self, box: Collapsible, configured_collapsed: bool, force_expanded: bool = False) -> None:
         """Start tracking a widget and apply its initial render state."""
-        box_id = id(box)
-        self.configured_collapsed[box_id] = configured_collapsed
-        self.suppressed_toggle_events[box_id] = self.suppressed_toggle_events.get(box_id, 0) + 1
+        self.configured_collapsed[box] = configured_collapsed
+        self.suppressed_toggle_events[box] = self.suppressed_toggle_events.get(box, 0) + 1
         if force_expanded:
-            self.forced_expanded_ids.add(box_id)
+            self.forced_expanded.add(box)
         else:
-            self.forced_expanded_ids.discard(box_id)
+            self.forced_expanded.discard(box)
         self.apply(box)
 
     def set_configured(self, box: Collapsible, collapsed: bool) -> None:
         """Update the configured collapsed state for a tracked widget."""
-        self.configured_collapsed[id(box)] = collapsed
+        self.configured_collapsed[box] = collapsed
         self.apply(box)
 
     def set_forced(self, box: Collapsible, enabled: bool) -> None:
         """Enable or disable forced expansion for a tracked widget."""
-        box_id = id(box)
         if enabled:
-            self.forced_expanded_ids.add(box_id)
+            self.forced_expanded.add(box)
         else:
-            self.forced_expanded_ids.discard(box_id)
+            self.forced_expanded.discard(box)
         self.apply(box)
 
     def apply(self, box: Collapsible) -> None:
         """Resolve and apply the current collapsed state for a widget."""
-        box_id = id(box)
-        configured_collapsed = self.configured_collapsed.get(box_id, box.collapsed)
-        manual_collapsed = self.manual_collapsed.get(box_id)
+        configured_collapsed = self.configured_collapsed.get(box, box.collapsed)
+        manual_collapsed = self.manual_collapsed.get(box)
         if self.expand_all_override:
             collapsed = False
         elif manual_collapsed is not None:
             collapsed = manual_collapsed
-        elif box_id in self.forced_expanded_ids:
+        elif box in self.forced_expanded:
             collapsed = False
         else:
             collapsed = configured_collapsed
@@ -162,42 +169,38 @@ class CollapseState:
         if box.collapsed == collapsed:
             return
 
-        self.suppressed_toggle_events[box_id] = self.suppressed_toggle_events.get(box_id, 0) + 1
+        self.suppressed_toggle_events[box] = self.suppressed_toggle_events.get(box, 0) + 1
         box.collapsed = collapsed
         self.schedule_scroll()
 
-    def toggle_expand_all(self, widgets: list[object]) -> None:
+    def toggle_expand_all(self) -> None:
         """Flip the global expand-all override and reapply all tracked widgets."""
         self.expand_all_override = not self.expand_all_override
-        for widget in widgets:
-            match widget:
-                case Collapsible() as box:
-                    self.apply(box)
+        for box in list(self.configured_collapsed):
+            self.apply(box)
 
     def consume_suppressed_toggle(self, box: Collapsible) -> bool:
         """Return `True` when a toggle event was caused by programmatic state."""
-        box_id = id(box)
-        remaining = self.suppressed_toggle_events.get(box_id, 0)
+        remaining = self.suppressed_toggle_events.get(box, 0)
         if remaining <= 0:
             return False
         if remaining == 1:
-            del self.suppressed_toggle_events[box_id]
+            del self.suppressed_toggle_events[box]
         else:
-            self.suppressed_toggle_events[box_id] = remaining - 1
+            self.suppressed_toggle_events[box] = remaining - 1
         return True
 
     def record_manual_toggle(self, box: Collapsible, collapsed: bool) -> None:
         """Persist a user-driven collapsed state for a tracked widget."""
-        box_id = id(box)
-        if box_id in self.configured_collapsed:
-            self.manual_collapsed[box_id] = collapsed
+        if box in self.configured_collapsed:
+            self.manual_collapsed[box] = collapsed
 
 
-def _find_slash_command_context(text: str, cursor: Location) -> SlashCommandContext | None:
+def _find_slash_command_context(line: str, cursor: Location) -> SlashCommandContext | None:
     """Detect a `/` at (0, 0) with cursor at (0, 1).
 
     Args:
-        text: Prompt text content.
+        line: Prompt line at the cursor row.
         cursor: Current cursor location as `(row, column)`.
 
     Returns:
@@ -206,10 +209,8 @@ def _find_slash_command_context(text: str, cursor: Location) -> SlashCommandCont
     row, col = cursor
     if row != 0 or col != 1:
         return None
-    lines = text.split("\n")
-    if not lines or not lines[0].startswith("/"):
+    if not line.startswith("/"):
         return None
-    line = lines[0]
     end_col = 1
     while end_col < len(line) and not line[end_col].isspace():
         end_col += 1
@@ -228,32 +229,24 @@ def _format_picked_path(path: Path, cwd: Path | None = None) -> str:
     """
     resolved = path.expanduser().resolve()
     base = (cwd or Path.cwd()).resolve()
-    try:
-        relative = resolved.relative_to(base)
-    except ValueError:
+    if not resolved.is_relative_to(base):
         return str(resolved)
-    if str(relative) == ".":
-        return "."
-    return str(relative)
+    return str(resolved.relative_to(base))
 
 
-def _find_at_trigger(text: str, cursor: Location) -> Location | None:
+def _find_at_trigger(line: str, cursor: Location) -> Location | None:
     """Return the position of `@` when cursor is immediately after it at a word boundary.
 
     Only triggers when `@` is at the start of the line or preceded by whitespace.
 
     Args:
-        text: Prompt text content.
+        line: Prompt line at the cursor row.
         cursor: Current cursor location as `(row, column)`.
 
     Returns:
         Position of the `@` character, or `None` when no trigger is active.
     """
     row, col = cursor
-    lines = text.split("\n")
-    if row >= len(lines):
-        return None
-    line = lines[row]
     if col <= 0 or col > len(line):
         return None
     if line[col - 1] != "@":
@@ -272,6 +265,13 @@ def _load_banner() -> Text | None:
     Returns:
         Parsed Rich `Text` banner, or `None` when the banner is unavailable.
     """
+    banner = _parse_banner()
+    # `Text` is mutable, each app gets its own copy of the cached banner.
+    return banner.copy() if banner is not None else None
+
+
+@cache
+def _parse_banner() -> Text | None:
     try:
         banner_ansi = _BANNER_PATH.read_text().strip("\n")
     except OSError:
@@ -281,12 +281,14 @@ def _load_banner() -> Text | None:
     return Text.from_ansi(banner_ansi)
 
 
+@cache
 def _load_freeact_version() -> str:
     """Resolve the installed freeact package version via metadata.
 
     Local build metadata (the `+...` suffix) is omitted for display because it
     can reflect an editable-install build identifier rather than the currently
-    checked-out source state.
+    checked-out source state. The result is cached because installed package
+    metadata does not change during a process.
     """
     try:
         version = package_version("freeact")
@@ -456,15 +458,29 @@ class TerminalApp(App[None]):
         self._skip_permissions = skip_permissions
         self._permission_manager = permission_manager or PermissionManager()
         self._clipboard_adapter = clipboard_adapter or ClipboardAdapter()
+        # Serializes OS clipboard access so copies land in order and pastes
+        # see the latest copy.
+        self._clipboard_lock = asyncio.Lock()
         self._skills_metadata = skills_metadata or []
         self._approval_future: asyncio.Future[tuple[int, str]] | None = None
+        self._approval_bar: ApprovalBar | None = None
         self._turn_in_progress = False
         self._collapse_state = CollapseState(schedule_scroll=self._schedule_scroll_conversation_to_bottom)
         self._pending_approval_widget_id: int | None = None
         self._tool_call_boxes: dict[str, ToolCallBoxState] = {}
+        self._scroll_pending = False
         self._banner = _load_banner()
         self._version = _load_freeact_version()
+        # The terminal process does not change its working directory while running.
+        self._working_dir = Path.cwd().resolve()
         self._cwd = _format_display_cwd()
+        # References are kept so that per-event handlers do not query the DOM.
+        self._conversation: VerticalScroll = VerticalScroll(id="conversation")
+        self._prompt_input: PromptInput = PromptInput(
+            id="prompt-input",
+            clipboard_reader=self.read_clipboard_for_paste,
+        )
+        self._input_hints: Static = Static("ctrl+q: quit", id="input-hints")
         self._bindings.bind(
             self._config.expand_all_toggle_key,
             "toggle_expand_all",
@@ -473,7 +489,7 @@ class TerminalApp(App[None]):
         )
 
     def compose(self) -> ComposeResult:
-        with VerticalScroll(id="conversation"):
+        with self._conversation:
             if self._banner is not None:
                 yield Static("", id="banner-top-spacer")
                 yield Static(self._banner, id="banner")
@@ -481,63 +497,69 @@ class TerminalApp(App[None]):
             yield Static(f"Version: {self._version}\n{self._cwd}", id="banner-metadata")
             yield Static("", id="banner-divider")
         with Vertical(id="input-dock"):
-            yield PromptInput(id="prompt-input", clipboard_reader=self.read_clipboard_for_paste)
-            yield Static("ctrl+q: quit", id="input-hints")
+            yield self._prompt_input
+            yield self._input_hints
 
     def _update_input_hints(self) -> None:
-        results = self.query("#input-hints")
-        if not results:
-            return
-        hints = results.first(Static)
+        hints = self._input_hints
         if self._turn_in_progress:
             hints.update("ctrl+q: quit  esc: interrupt")
-        elif self.query_one("#prompt-input", PromptInput).text:
+        elif self._prompt_input.text:
             hints.update("ctrl+q: quit  esc: clear")
         else:
             hints.update("ctrl+q: quit")
 
     def copy_to_clipboard(self, text: str) -> None:
         """Copy to OS clipboard and mirror into Textual's local clipboard cache."""
-        self._clipboard_adapter.copy(text)
         self._clipboard = text
+        self._copy_to_os_clipboard(text)
 
-    def read_clipboard_for_paste(self) -> str:
+    @work(group="clipboard")
+    async def _copy_to_os_clipboard(self, text: str) -> None:
+        # clipboard commands are subprocesses, keep them off the event loop
+        async with self._clipboard_lock:
+            await arun(self._clipboard_adapter.copy, text)
+
+    async def read_clipboard_for_paste(self) -> str:
         """Read from OS clipboard first, falling back to Textual local clipboard."""
-        system_clipboard = self._clipboard_adapter.paste()
+        async with self._clipboard_lock:
+            system_clipboard = await arun(self._clipboard_adapter.paste)
         if system_clipboard is not None:
             self._clipboard = system_clipboard
             return system_clipboard
         return self.clipboard
 
     def on_mount(self) -> None:
-        self.query_one("#prompt-input", PromptInput).focus()
+        self._prompt_input.focus()
         self.call_after_refresh(self._scroll_conversation_to_bottom)
 
     def _scroll_conversation_to_bottom(self) -> None:
         """Position the conversation viewport at the latest content."""
-        conversation = self.query_one("#conversation", VerticalScroll)
-        conversation.scroll_end(animate=False)
+        self._scroll_pending = False
+        self._conversation.scroll_end(animate=False)
 
     def _schedule_scroll_conversation_to_bottom(self) -> None:
-        """Re-apply bottom alignment after the next layout refresh."""
+        """Re-apply bottom alignment after the next layout refresh.
+
+        Requests made before the scheduled scroll runs are coalesced into it.
+        """
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
         self.call_after_refresh(self._scroll_conversation_to_bottom)
 
     async def _mount_and_scroll(
         self,
         target: Vertical | VerticalScroll,
-        conversation: VerticalScroll,
         *widgets: "textual.widget.Widget",  # type: ignore[name-defined]  # noqa: F821
     ) -> None:
-        """Mount widgets into a target container and scroll to the bottom.
+        """Mount widgets into a target container and scroll the conversation to the bottom.
 
         Args:
             target: Container that owns the widgets.
-            conversation: Root conversation container used for scrolling.
             *widgets: Widgets to mount in order.
         """
-        for widget in widgets:
-            await target.mount(widget)
-        conversation.scroll_end(animate=False)
+        await target.mount(*widgets)
         self._schedule_scroll_conversation_to_bottom()
 
     def on_collapsible_expanded(self, event: Collapsible.Expanded) -> None:
@@ -592,14 +614,14 @@ class TerminalApp(App[None]):
 
     @work(exclusive=True)
     async def _process_turn(self, text: str) -> None:
-        prompt_input = self.query_one("#prompt-input", PromptInput)
-        conversation = self.query_one("#conversation", VerticalScroll)
+        prompt_input = self._prompt_input
+        conversation = self._conversation
         prompt_input.disabled = True
         conversation.anchor()
 
         user_box = create_user_input_box(text)
         self._collapse_state.register(user_box, configured_collapsed=False)
-        await self._mount_and_scroll(conversation, conversation, user_box)
+        await self._mount_and_scroll(conversation, user_box)
 
         turn_state = TurnRenderState()
 
@@ -613,7 +635,7 @@ class TerminalApp(App[None]):
         except Exception as e:
             error_box = create_error_box(f"{type(e).__name__}: {e}")
             self._collapse_state.register(error_box, configured_collapsed=False)
-            await self._mount_and_scroll(conversation, conversation, error_box)
+            await self._mount_and_scroll(conversation, error_box)
         finally:
             self._clear_turn_tool_call_state()
             self._turn_in_progress = False
@@ -627,14 +649,16 @@ class TerminalApp(App[None]):
         conversation: VerticalScroll,
         turn_state: TurnRenderState,
     ) -> None:
+        # Evaluated once instead of in the guard of every main-agent case.
+        is_main = event.agent_id == self._agent_id
         match event:
-            case ThoughtsChunk(agent_id=aid, content=chunk) if aid == self._agent_id:
+            case ThoughtsChunk(agent_id=aid, content=chunk) if is_main:
                 await self._handle_main_thoughts_chunk(aid, chunk, conversation, turn_state)
-            case Thoughts(agent_id=aid) if aid == self._agent_id:
-                await self._handle_main_thoughts_complete(conversation, turn_state)
-            case ResponseChunk(agent_id=aid, content=chunk) if aid == self._agent_id:
+            case Thoughts() if is_main:
+                await self._handle_main_thoughts_complete(turn_state)
+            case ResponseChunk(agent_id=aid, content=chunk) if is_main:
                 await self._handle_main_response_chunk(aid, chunk, conversation, turn_state)
-            case Response(agent_id=aid) if aid == self._agent_id:
+            case Response() if is_main:
                 await self._handle_main_response_complete(turn_state)
             case ApprovalRequest() as request:
                 await self._handle_approval(request, conversation)
@@ -664,27 +688,23 @@ class TerminalApp(App[None]):
         if turn_state.thoughts_stream is None:
             box, md = create_thoughts_box(agent_id)
             self._collapse_state.register(box, configured_collapsed=False)
-            await self._mount_and_scroll(conversation, conversation, box)
+            await self._mount_and_scroll(conversation, box)
             turn_state.thoughts_stream = Markdown.get_stream(md)
+            turn_state.thoughts_box = box
 
         stream = turn_state.thoughts_stream
         if stream is not None:
             await stream.write(chunk)
 
-    async def _handle_main_thoughts_complete(
-        self,
-        conversation: VerticalScroll,
-        turn_state: TurnRenderState,
-    ) -> None:
+    async def _handle_main_thoughts_complete(self, turn_state: TurnRenderState) -> None:
         if turn_state.thoughts_stream is None:
             return
         await turn_state.thoughts_stream.stop()
+        thoughts_box = turn_state.thoughts_box
         turn_state.thoughts_stream = None
-        if not self._config.collapse_thoughts_on_complete:
-            return
-        match conversation.query(".thoughts-box").last():
-            case Collapsible() as last_box:
-                self._collapse_state.set_configured(last_box, collapsed=True)
+        turn_state.thoughts_box = None
+        if thoughts_box is not None and self._config.collapse_thoughts_on_complete:
+            self._collapse_state.set_configured(thoughts_box, collapsed=True)
 
     async def _handle_main_response_chunk(
         self,
@@ -696,7 +716,7 @@ class TerminalApp(App[None]):
         if turn_state.response_stream is None:
             box, md = create_response_box(agent_id)
             self._collapse_state.register(box, configured_collapsed=False)
-            await self._mount_and_scroll(conversation, conversation, box)
+            await self._mount_and_scroll(conversation, box)
             turn_state.response_stream = Markdown.get_stream(md)
 
         stream = turn_state.response_stream
@@ -726,7 +746,7 @@ class TerminalApp(App[None]):
         self._collapse_state.register(box, configured_collapsed=False)
         tc_state = self._resolve_tool_call_state(corr_id, parent_corr_id)
         mount_target = tc_state.trace_container if tc_state is not None else conversation
-        await self._mount_and_scroll(mount_target, conversation, box)
+        await self._mount_and_scroll(mount_target, box)
         exec_state = ExecOutputState(box=box, log=exec_log)
         turn_state.exec_logs[exec_key] = exec_state
         return exec_state, True
@@ -747,6 +767,18 @@ class TerminalApp(App[None]):
             conversation,
             turn_state,
         )
+        exec_state.pending.append(text)
+        if not exec_state.flush_scheduled:
+            exec_state.flush_scheduled = True
+            self.call_after_refresh(self._flush_exec_output, exec_state)
+
+    def _flush_exec_output(self, exec_state: ExecOutputState) -> None:
+        # chunks arriving between refreshes are written as one RichLog entry
+        exec_state.flush_scheduled = False
+        if not exec_state.pending:
+            return
+        text = "".join(exec_state.pending)
+        exec_state.pending.clear()
         exec_state.log.write(text)
         self._schedule_scroll_conversation_to_bottom()
 
@@ -768,6 +800,7 @@ class TerminalApp(App[None]):
             conversation,
             turn_state,
         )
+        self._flush_exec_output(exec_state)
         await finalize_exec_output(exec_state.log, text, images)
         if self._config.collapse_exec_output_on_complete:
             self._collapse_state.set_configured(exec_state.box, collapsed=True)
@@ -788,7 +821,7 @@ class TerminalApp(App[None]):
             box,
             configured_collapsed=self._config.collapse_tool_outputs,
         )
-        await self._mount_and_scroll(self._event_target(event, conversation), conversation, box)
+        await self._mount_and_scroll(self._event_target(event, conversation), box)
         state = self._tool_call_boxes.get(corr_id)
         if state is not None and state.is_subagent_task and not event.parent_corr_id:
             self._mark_subagent_task_completed(corr_id)
@@ -862,10 +895,9 @@ class TerminalApp(App[None]):
         self._collapse_state.register(box, configured_collapsed=False, force_expanded=pin_pending)
         if pin_pending:
             self._pending_approval_widget_id = id(box)
-        await self._mount_and_scroll(target, conversation, box)
+        await self._mount_and_scroll(target, box)
 
         # Check pre-approval
-        suggested = suggest_pattern(tc)
         pre_approved = self._skip_permissions or self._permission_manager.is_allowed(tc)
 
         if pre_approved:
@@ -883,12 +915,15 @@ class TerminalApp(App[None]):
 
         # Prompt user for approval
         self._approval_future = asyncio.get_running_loop().create_future()
-        bar = ApprovalBar(pattern=suggested, display_text=suggest_display(tc))
-        await self._mount_and_scroll(conversation, conversation, bar)
+        # Only suggested when prompting, pre-approved calls skip the pattern derivation.
+        bar = ApprovalBar(pattern=suggest_pattern(tc), display_text=suggest_display(tc))
+        await self._mount_and_scroll(conversation, bar)
+        self._approval_bar = bar
 
         decision, pattern = await self._approval_future
         self._approval_future = None
 
+        self._approval_bar = None
         await bar.remove()
         if self._pending_approval_widget_id == id(box):
             self._pending_approval_widget_id = None
@@ -924,17 +959,17 @@ class TerminalApp(App[None]):
         if action == "approve_hotkey":
             if not self._has_pending_approval():
                 return False
-            bars = self.query("ApprovalBar")
-            if bars and bars.last().editing:
+            bar = self._approval_bar
+            if bar is not None and bar.editing:
                 return False
             return True
         if action == "approval_rule_hotkey":
             if not self._has_pending_approval():
                 return False
-            bars = self.query("ApprovalBar")
-            if not bars:
+            bar = self._approval_bar
+            if bar is None:
                 return False
-            return not bars.last().editing
+            return not bar.editing
         if action == "cancel_turn":
             return self._turn_in_progress and self._cancel_fn is not None
         return super().check_action(action, parameters)
@@ -949,18 +984,18 @@ class TerminalApp(App[None]):
         future = self._approval_future
         if future is not None and not future.done():
             # Read pattern from the current ApprovalBar if available
-            bars = self.query("ApprovalBar")
-            pattern = bars.last().pattern if bars else ""
+            bar = self._approval_bar
+            pattern = bar.pattern if bar is not None else ""
             future.set_result((decision, pattern))
 
     def action_approval_rule_hotkey(self, scope: int) -> None:
-        bars = self.query("ApprovalBar")
-        if not bars:
+        bar = self._approval_bar
+        if bar is None:
             return
-        bars.last().action_save_rule(scope)
+        bar.action_save_rule(scope)
 
     def action_toggle_expand_all(self) -> None:
-        self._collapse_state.toggle_expand_all(list(self.query("Collapsible")))
+        self._collapse_state.toggle_expand_all()
 
     def _has_pending_approval(self) -> bool:
         if self._approval_future is not None and not self._approval_future.done():
@@ -979,14 +1014,21 @@ class TerminalApp(App[None]):
     # --- Picker integration ---
 
     def on_text_area_changed(self, event: "textual.widgets.TextArea.Changed") -> None:  # type: ignore[name-defined]  # noqa: F821
-        if event.text_area.id != "prompt-input":
+        text_area = event.text_area
+        if text_area.id != "prompt-input":
             return
         self._update_input_hints()
-        slash_ctx = _find_slash_command_context(event.text_area.text, event.text_area.cursor_location)
+        cursor = text_area.cursor_location
+        row, col = cursor
+        # Only the cursor line is needed, `TextArea.text` would join all lines.
+        line = text_area.document.get_line(row)
+        if col == 0 or line[col - 1] not in ("/", "@"):
+            return
+        slash_ctx = _find_slash_command_context(line, cursor)
         if slash_ctx is not None and self._skills_metadata:
             self._open_skill_picker(slash_ctx)
             return
-        at_pos = _find_at_trigger(event.text_area.text, event.text_area.cursor_location)
+        at_pos = _find_at_trigger(line, cursor)
         if at_pos is not None:
             self._open_file_picker(at_pos)
 
@@ -995,9 +1037,8 @@ class TerminalApp(App[None]):
 
         async def handle_result(path: Path | None) -> None:
             if path is not None:
-                prompt_input = self.query_one("#prompt-input", PromptInput)
-                prompt_input.replace(
-                    _format_picked_path(path),
+                self._prompt_input.replace(
+                    _format_picked_path(path, cwd=self._working_dir),
                     at_pos,
                     at_end,
                 )
@@ -1010,8 +1051,7 @@ class TerminalApp(App[None]):
     def _open_skill_picker(self, context: SlashCommandContext) -> None:
         async def handle_result(skill_name: str | None) -> None:
             if skill_name is not None:
-                prompt_input = self.query_one("#prompt-input", PromptInput)
-                prompt_input.replace(
+                self._prompt_input.replace(
                     f"{skill_name} ",
                     context.start,
                     context.end,
@@ -1033,16 +1073,16 @@ def convert_slash_commands(text: str, skills: list[SkillMetadata]) -> str:
     Returns:
         Text with leading slash command replaced by a skill tag, or unchanged text.
     """
-    match = re.match(r"^/(\S+)([\s\S]*)", text)
+    if not text.startswith("/"):
+        return text
+    match = _SLASH_COMMAND_PATTERN.match(text)
     if match is None:
         return text
     name = match.group(1)
     args = match.group(2).strip()
-    skills_by_name = {s.name: s for s in skills}
-    skill = skills_by_name.get(name)
-    if skill is None:
+    if not any(skill.name == name for skill in skills):
         return text
-    return f'<skill name="{skill.name}">{args}</skill>'
+    return f'<skill name="{name}">{args}</skill>'
 
 
 __all__ = [
@@ -1,8 +1,10 @@
 import os
 import platform
+import shutil
 import subprocess
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol, TypeAlias
 
 ClipboardCommand: TypeAlias = tuple[str, ...]
@@ -11,6 +13,9 @@ RunClipboardCommand: TypeAlias = Callable[
     subprocess.CompletedProcess[str] | None,
 ]
 
+# The host platform cannot change while the process runs.
+_SYSTEM_NAME = platform.system()
+
 
 class ClipboardAdapterProtocol(Protocol):
     """Interface for clipboard access used by the terminal UI."""
@@ -30,10 +35,18 @@ class ClipboardBackend:
     paste_command: ClipboardCommand
 
 
+@lru_cache(maxsize=None)
+def _is_available(executable: str) -> bool:
+    """Check once per process whether a clipboard executable is on `PATH`."""
+    return shutil.which(executable) is not None
+
+
 def _default_run_command(
     command: ClipboardCommand, input_text: str | None, timeout: float
 ) -> subprocess.CompletedProcess[str] | None:
     """Run a clipboard command and return process output when available."""
+    if not _is_available(command[0]):
+        return None
     try:
         return subprocess.run(
             command,
@@ -54,68 +67,53 @@ def _is_wayland(env: Mapping[str, str]) -> bool:
     return env.get("XDG_SESSION_TYPE", "").lower() == "wayland"
 
 
-def _linux_backends(env: Mapping[str, str]) -> tuple[ClipboardBackend, ...]:
-    """Get Linux clipboard command candidates in preferred order."""
-    wl_backend = ClipboardBackend(copy_command=("wl-copy",), paste_command=("wl-paste", "--no-newline"))
-    xclip_backend = ClipboardBackend(
-        copy_command=("xclip", "-selection", "clipboard"),
-        paste_command=("xclip", "-selection", "clipboard", "-o"),
-    )
-    xsel_backend = ClipboardBackend(
-        copy_command=("xsel", "--clipboard", "--input"),
-        paste_command=("xsel", "--clipboard", "--output"),
-    )
-    if _is_wayland(env):
-        return (wl_backend, xclip_backend, xsel_backend)
-    return (xclip_backend, xsel_backend, wl_backend)
-
-
-def _windows_backends() -> tuple[ClipboardBackend, ...]:
-    """Get Windows clipboard command candidates in preferred order."""
-    powershell_backend = ClipboardBackend(
+def _powershell_backend(executable: str) -> ClipboardBackend:
+    """Create a PowerShell clipboard backend for the given executable."""
+    return ClipboardBackend(
         copy_command=(
-            "powershell",
+            executable,
             "-NoProfile",
             "-NonInteractive",
             "-Command",
             "$input | Set-Clipboard",
         ),
         paste_command=(
-            "powershell",
+            executable,
             "-NoProfile",
             "-NonInteractive",
             "-Command",
             "Get-Clipboard -Raw",
         ),
     )
-    pwsh_backend = ClipboardBackend(
-        copy_command=(
-            "pwsh",
-            "-NoProfile",
-            "-NonInteractive",
-            "-Command",
-            "$input | Set-Clipboard",
-        ),
-        paste_command=(
-            "pwsh",
-            "-NoProfile",
-            "-NonInteractive",
-            "-Command",
-            "Get-Clipboard -Raw",
-        ),
-    )
-    return (powershell_backend, pwsh_backend)
+
+
+_PBCOPY_BACKEND = ClipboardBackend(copy_command=("pbcopy",), paste_command=("pbpaste",))
+_WL_BACKEND = ClipboardBackend(copy_command=("wl-copy",), paste_command=("wl-paste", "--no-newline"))
+_XCLIP_BACKEND = ClipboardBackend(
+    copy_command=("xclip", "-selection", "clipboard"),
+    paste_command=("xclip", "-selection", "clipboard", "-o"),
+)
+_XSEL_BACKEND = ClipboardBackend(
+    copy_command=("xsel", "--clipboard", "--input"),
+    paste_command=("xsel", "--clipboard", "--output"),
+)
+
+# Candidate backends per platform in preferred order.
+_DARWIN_BACKENDS = (_PBCOPY_BACKEND,)
+_LINUX_WAYLAND_BACKENDS = (_WL_BACKEND, _XCLIP_BACKEND, _XSEL_BACKEND)
+_LINUX_X11_BACKENDS = (_XCLIP_BACKEND, _XSEL_BACKEND, _WL_BACKEND)
+_WINDOWS_BACKENDS = (_powershell_backend("powershell"), _powershell_backend("pwsh"))
 
 
 def _candidate_backends(system_name: str, env: Mapping[str, str]) -> tuple[ClipboardBackend, ...]:
     """Resolve clipboard backends for the active platform."""
     match system_name:
         case "Darwin":
-            return (ClipboardBackend(copy_command=("pbcopy",), paste_command=("pbpaste",)),)
+            return _DARWIN_BACKENDS
         case "Linux":
-            return _linux_backends(env)
+            return _LINUX_WAYLAND_BACKENDS if _is_wayland(env) else _LINUX_X11_BACKENDS
         case "Windows":
-            return _windows_backends()
+            return _WINDOWS_BACKENDS
         case _:
             return ()
 
@@ -130,22 +128,31 @@ class ClipboardAdapter(ClipboardAdapterProtocol):
         timeout: float = 0.75,
         run_command: RunClipboardCommand | None = None,
     ) -> None:
-        self._system_name = system_name or platform.system()
+        self._system_name = system_name or _SYSTEM_NAME
         self._env = env or os.environ
         self._timeout = timeout
         self._run_command = run_command or _default_run_command
         self._backends = _candidate_backends(self._system_name, self._env)
+        self._active: ClipboardBackend | None = None
 
     def copy(self, text: str) -> bool:
-        for backend in self._backends:
+        for backend in self._ordered_backends():
             result = self._run_command(backend.copy_command, text, self._timeout)
             if result is not None and result.returncode == 0:
+                self._active = backend
                 return True
         return False
 
     def paste(self) -> str | None:
-        for backend in self._backends:
+        for backend in self._ordered_backends():
             result = self._run_command(backend.paste_command, None, self._timeout)
             if result is not None and result.returncode == 0:
+                self._active = backend
                 return result.stdout
         return None
+
+    def _ordered_backends(self) -> tuple[ClipboardBackend, ...]:
+        """Get backends with the last working one first, followed by the remaining candidates."""
+        if self._active is None:
+            return self._backends
+        return (self._active, *(backend for backend in self._backends if backend is not self._active))
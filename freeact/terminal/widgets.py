@@ -1,5 +1,5 @@
 import json
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -25,6 +25,14 @@ ANSI_SEQUENCES_KEYS["\x1b\r"] = (Keys.ControlJ,)  # type: ignore[index]
 _PROMPT_GUTTER = "> "
 _GUTTER_WIDTH = len(_PROMPT_GUTTER)
 
+# Resolved once so that each syntax-highlighted box does not look up and
+# instantiate the Pygments style again.
+_SYNTAX_THEME = Syntax.get_theme("monokai")
+
+# Streaming execution output keeps only the most recent lines. The complete
+# output replaces the log when execution finishes (see `finalize_exec_output`).
+_EXEC_OUTPUT_MAX_LINES = 1000
+
 
 class PromptInput(TextArea):
     """Prompt input area with submit-on-enter behavior.
@@ -58,7 +66,7 @@ class PromptInput(TextArea):
             super().__init__()
             self.text = text
 
-    def __init__(self, clipboard_reader: Callable[[], str] | None = None, **kwargs: Any) -> None:
+    def __init__(self, clipboard_reader: Callable[[], Awaitable[str]] | None = None, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.show_line_numbers = False
         self.soft_wrap = True
@@ -101,11 +109,11 @@ class PromptInput(TextArea):
             self.post_message(self.Submitted(text))
             self.clear()
 
-    def action_paste(self) -> None:
+    async def action_paste(self) -> None:  # type: ignore[override]
         """Paste text using the app-provided clipboard reader when available."""
         if self.read_only:
             return
-        clipboard = self._clipboard_reader() if self._clipboard_reader is not None else self.app.clipboard
+        clipboard = await self._clipboard_reader() if self._clipboard_reader is not None else self.app.clipboard
         if result := self._replace_via_keyboard(clipboard, *self.selection):
             self.move_cursor(result.end_location)
             self.focus()
@@ -251,11 +259,9 @@ def _titled(label: str, agent_id: str) -> str:
     Returns:
         Title string formatted for collapsible box headers.
     """
-    parts: list[str] = []
     if agent_id:
-        parts.append(f"\\[{agent_id}]")
-    parts.append(label)
-    return " ".join(parts)
+        return f"\\[{agent_id}] {label}"
+    return label
 
 
 def _wrap_with_trace_container(*children: Widget) -> tuple[Vertical, Vertical]:
@@ -331,7 +337,7 @@ def create_code_action_box(code: str, agent_id: str = "") -> tuple[Collapsible,
     Returns:
         Tuple of the Collapsible widget and the nested trace container.
     """
-    syntax = Syntax(code, "python", theme="monokai")
+    syntax = Syntax(code, "python", theme=_SYNTAX_THEME)
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content,
@@ -352,7 +358,7 @@ def create_shell_command_box(command: str, agent_id: str = "") -> tuple[Collapsi
     Returns:
         Tuple of the Collapsible widget and the nested trace container.
     """
-    syntax = Syntax(command, "bash", theme="monokai")
+    syntax = Syntax(command, "bash", theme=_SYNTAX_THEME)
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content,
@@ -373,7 +379,7 @@ def create_shell_script_box(script: str, agent_id: str = "") -> tuple[Collapsibl
     Returns:
         Tuple of the Collapsible widget and the nested trace container.
     """
-    syntax = Syntax(script, "bash", theme="monokai")
+    syntax = Syntax(script, "bash", theme=_SYNTAX_THEME)
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content,
@@ -402,7 +408,7 @@ def create_tool_call_box(
         Tuple of the Collapsible widget and the nested trace container.
     """
     args_json = json.dumps(tool_args, indent=2)
-    syntax = Syntax(args_json, "json", theme="monokai")
+    syntax = Syntax(args_json, "json", theme=_SYNTAX_THEME)
     title_prefix = "PTC" if ptc else "Tool Call"
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
@@ -428,7 +434,7 @@ def create_subagent_task_box(
         Tuple of the task Collapsible and the nested child-widget container.
     """
     args_json = json.dumps(tool_args, indent=2)
-    syntax = Syntax(args_json, "json", theme="monokai")
+    syntax = Syntax(args_json, "json", theme=_SYNTAX_THEME)
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content,
@@ -448,7 +454,7 @@ def create_exec_output_box(agent_id: str = "") -> tuple[Collapsible, RichLog]:
     Returns:
         Tuple of the Collapsible widget and the RichLog widget inside it.
     """
-    log = RichLog(wrap=True, markup=False)
+    log = RichLog(wrap=True, markup=False, max_lines=_EXEC_OUTPUT_MAX_LINES)
     box = Collapsible(log, title=_titled("Execution Output", agent_id), collapsed=False, classes="exec-output-box")
     return box, log
 
@@ -464,17 +470,19 @@ async def finalize_exec_output(log: RichLog, text: str | None, images: list[Path
         text: Final text output.
         images: Generated image paths to append.
     """
+    if not text and not images:
+        return
     parts: list[str] = []
     if text:
         parts.append(text.rstrip("\n"))
     if images:
-        parts.append("Produced images:\n" + "\n".join(f"  {path}" for path in images))
-    if parts and log.parent is not None:
+        parts.append("\n".join(["Produced images:", *(f"  {path}" for path in images)]))
+    if log.parent is not None:
         static = Static("\n".join(parts), markup=False)
         await log.parent.mount(static, after=log)
         await log.remove()
     elif images:
-        log.write("Produced images:\n" + "\n".join(f"  {path}" for path in images))
+        log.write(parts[-1])
 
 
 def create_tool_output_box(content: str, agent_id: str = "") -> Collapsible:
@@ -488,7 +496,7 @@ def create_tool_output_box(content: str, agent_id: str = "") -> Collapsible:
         Collapsible widget that displays truncated tool output.
     """
     display_content = content
-    syntax = Syntax(display_content, "text", theme="monokai")
+    syntax = Syntax(display_content, "text", theme=_SYNTAX_THEME)
     box = Collapsible(
         Static(_syntax_to_content(syntax)),
         title=_titled("Tool Output", agent_id),
@@ -562,7 +570,7 @@ def create_file_write_action_box(path: str, content: str, agent_id: str = "") ->
         Tuple of the Collapsible widget and the nested trace container.
     """
     ext = path.rsplit(".", 1)[-1] if "." in path else "text"
-    syntax = Syntax(content, ext, theme="monokai")
+    syntax = Syntax(content, ext, theme=_SYNTAX_THEME)
     content_widget, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content_widget,
@@ -601,7 +609,7 @@ def create_file_edit_action_box(
         diff_lines.append(f"+{line}")
 
     diff_text = "\n".join(diff_lines)
-    syntax = Syntax(diff_text, "diff", theme="monokai")
+    syntax = Syntax(diff_text, "diff", theme=_SYNTAX_THEME)
     content, trace_container = _wrap_with_trace_container(Static(_syntax_to_content(syntax)))
     box = Collapsible(
         content,
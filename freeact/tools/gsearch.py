@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 from typing import Annotated
 
 import httpx
@@ -11,12 +12,30 @@ mcp = FastMCP("google_mcp", log_level="ERROR")
 
 _thinking_level: str = "medium"
 
+# Shared across tool calls so that connection pools (and TLS sessions) to the
+# Gemini API and the grounding redirect host are reused.
+_genai_client: genai.Client | None = None
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_genai_client() -> genai.Client:
+    global _genai_client
+    if _genai_client is None:
+        _genai_client = genai.Client()
+    return _genai_client
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(follow_redirects=True)
+    return _http_client
+
 
 async def _get_redirect_target(url: str) -> str:
     """Follow redirects and return the final URL."""
-    async with httpx.AsyncClient(follow_redirects=True) as client:
-        response = await client.head(url)
-        return str(response.url)
+    response = await _get_http_client().head(url)
+    return str(response.url)
 
 
 @mcp.tool(
@@ -42,7 +61,7 @@ async def web_search(
     synthesized answer (not raw search results) followed by numbered source URLs.
     Query should be natural language, e.g., "Who is the author of X?".
     """
-    client = genai.Client()
+    client = _get_genai_client()
 
     config = types.GenerateContentConfig(
         tools=[types.Tool(google_search=types.GoogleSearch())],
@@ -62,11 +81,17 @@ async def web_search(
     if response.candidates and response.candidates[0].grounding_metadata:
         metadata = response.candidates[0].grounding_metadata
         if metadata.grounding_chunks:
-            references: list[str] = []
+            web_uris: dict[int, str] = {}
             for i, chunk in enumerate(metadata.grounding_chunks):
-                if chunk.web:
-                    target_url = await _get_redirect_target(chunk.web.uri)
-                    references.append(f"[{i + 1}]: {target_url}")
+                if chunk.web and chunk.web.uri:
+                    web_uris[i] = chunk.web.uri
+
+            # Resolve each distinct redirect URL once, all concurrently
+            unique_uris = list(dict.fromkeys(web_uris.values()))
+            target_urls = await asyncio.gather(*(_get_redirect_target(uri) for uri in unique_uris))
+            targets = dict(zip(unique_uris, target_urls))
+
+            references = [f"[{i + 1}]: {targets[uri]}" for i, uri in web_uris.items()]
             if references:
                 result_parts.append("")
                 result_parts.extend(references)
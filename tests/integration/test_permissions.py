@@ -237,6 +237,17 @@ class TestPersistenceRoundtrip:
         assert m2.is_allowed(GenericCall(tool_name="github_search", tool_args={}, ptc=False))
         assert m2.is_allowed(ShellAction(tool_name="bash", command="git status"))
 
+    def test_roundtrip_non_ascii_pattern(self, freeact_dir: Path, working_dir: Path) -> None:
+        m1 = PermissionManager(working_dir, freeact_dir)
+        m1.allow_always(ShellAction(tool_name="bash", command="cat résumé_*.txt"))
+
+        content = (freeact_dir / "permissions.json").read_bytes().decode("utf-8")
+        assert "résumé_*.txt" in content
+
+        m2 = PermissionManager(working_dir, freeact_dir)
+        m2.load()
+        assert m2.is_allowed(ShellAction(tool_name="bash", command="cat résumé_2024.txt"))
+
     def test_load_missing_file_keeps_defaults(self, freeact_dir: Path, working_dir: Path) -> None:
         manager = PermissionManager(working_dir, freeact_dir)
         manager.load()
@@ -277,6 +288,18 @@ class TestAllowMethods:
         permission_manager.allow_session(tc)
         assert len(permission_manager._session.allow) == 1
 
+    def test_new_rules_apply_to_previously_checked_calls(self, permission_manager: PermissionManager) -> None:
+        shell = ShellAction(tool_name="bash", command="make test")
+        generic = GenericCall(tool_name="github_search", tool_args={}, ptc=False)
+        assert not permission_manager.is_allowed(shell)
+        assert not permission_manager.is_allowed(generic)
+
+        permission_manager.allow_session(ShellAction(tool_name="bash", command="make *"))
+        permission_manager.allow_always(GenericCall(tool_name="github_*", tool_args={}, ptc=False))
+
+        assert permission_manager.is_allowed(shell)
+        assert permission_manager.is_allowed(generic)
+
 
 class TestPermissionManagerInit:
     """Tests for initialization behavior."""
@@ -1,4 +1,6 @@
 import asyncio
+import threading
+import time
 from collections.abc import AsyncIterator, Callable, Sequence
 from pathlib import Path
 
@@ -8,7 +10,7 @@ from rich.text import Text
 from textual._ansi_sequences import ANSI_SEQUENCES_KEYS
 from textual.keys import Keys
 from textual.pilot import Pilot
-from textual.widgets import Static
+from textual.widgets import RichLog, Static
 
 from freeact.agent.call import CodeAction, FileEdit, FileWrite, GenericCall, ShellAction, ToolCall
 from freeact.agent.config.skills import SkillMetadata
@@ -176,8 +178,12 @@ def test_format_display_cwd_prefers_tilde_relative_home(tmp_path: Path) -> None:
 
 def test_load_freeact_version_omits_local_build_metadata(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("freeact.terminal.app.package_version", lambda _: "0.8.1.post1.dev0+6937613")
+    _load_freeact_version.cache_clear()
 
-    assert _load_freeact_version() == "0.8.1.post1.dev0"
+    try:
+        assert _load_freeact_version() == "0.8.1.post1.dev0"
+    finally:
+        _load_freeact_version.cache_clear()
 
 
 @pytest.mark.asyncio
@@ -520,6 +526,70 @@ async def test_prompt_paste_preserves_empty_os_clipboard_without_local_fallback(
         assert app.clipboard == ""
 
 
+class SlowClipboardAdapter(StubClipboardAdapter):
+    """Clipboard adapter stub whose first copy finishes after later ones."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.value: str | None = None
+        self.copy_started = 0
+        self.paste_threads: list[int] = []
+        self.pasted: list[str | None] = []
+
+    def copy(self, text: str) -> bool:
+        self.copy_started += 1
+        if self.copy_started == 1:
+            time.sleep(0.2)
+        self.copy_calls.append(text)
+        self.value = text
+        return True
+
+    def paste(self) -> str | None:
+        self.paste_threads.append(threading.get_ident())
+        self.pasted.append(self.value)
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_os_clipboard_copies_complete_in_order() -> None:
+    clipboard_adapter = SlowClipboardAdapter()
+    app = _create_app(
+        agent_stream=MockStreamAgent(_no_events).stream,
+        agent_id=MAIN_AGENT_ID,
+        clipboard_adapter=clipboard_adapter,
+    )
+
+    async with app.run_test():
+        app.copy_to_clipboard("first")
+        app.copy_to_clipboard("second")
+        await app.workers.wait_for_complete()
+
+        assert clipboard_adapter.copy_calls == ["first", "second"]
+        assert clipboard_adapter.value == "second"
+        assert app.clipboard == "second"
+
+
+@pytest.mark.asyncio
+async def test_prompt_paste_reads_os_clipboard_off_event_loop_after_pending_copy() -> None:
+    clipboard_adapter = SlowClipboardAdapter()
+    app = _create_app(
+        agent_stream=MockStreamAgent(_no_events).stream,
+        agent_id=MAIN_AGENT_ID,
+        clipboard_adapter=clipboard_adapter,
+    )
+
+    async with app.run_test() as pilot:
+        app.copy_to_clipboard("copied")
+        await pilot.press("ctrl+v")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        prompt = app.query_one("#prompt-input", PromptInput)
+        assert prompt.text == "copied"
+        assert clipboard_adapter.pasted == ["copied"]
+        assert threading.get_ident() not in clipboard_adapter.paste_threads
+
+
 @pytest.mark.asyncio
 async def test_ctrl_q_triggers_quit_action(monkeypatch: pytest.MonkeyPatch) -> None:
     app = _create_app(agent_stream=MockStreamAgent(_no_events).stream, agent_id=MAIN_AGENT_ID)
@@ -1047,6 +1117,24 @@ async def test_typing_at_opens_file_picker_screen() -> None:
         assert any(isinstance(screen, FilePickerScreen) for screen in app.screen_stack)
 
 
+@pytest.mark.asyncio
+async def test_typing_at_on_later_line_opens_file_picker_screen() -> None:
+    app = _create_app(agent_stream=MockStreamAgent(_no_events).stream, agent_id=MAIN_AGENT_ID)
+
+    async with app.run_test() as pilot:
+        prompt = app.query_one("#prompt-input", PromptInput)
+        prompt.insert("first line\nsecond ")
+        prompt.cursor_location = (1, 7)
+        await pilot.press("@")
+        await pilot.pause(0.05)
+
+        picker = next(screen for screen in app.screen_stack if isinstance(screen, FilePickerScreen))
+        picker.dismiss(Path.cwd() / "new")
+        await pilot.pause(0.05)
+
+        assert prompt.text == "first line\nsecond new"
+
+
 @pytest.mark.asyncio
 async def test_file_picker_starts_at_filesystem_root() -> None:
     app = _create_app(agent_stream=MockStreamAgent(_no_events).stream, agent_id=MAIN_AGENT_ID)
@@ -1175,8 +1263,7 @@ def test_find_slash_command_context_not_at_start() -> None:
 
 
 def test_find_slash_command_context_not_first_row() -> None:
-    text = "line0\n/"
-    assert _find_slash_command_context(text, (1, 1)) is None
+    assert _find_slash_command_context("/", (1, 1)) is None
 
 
 def test_find_slash_command_context_cursor_not_after_slash() -> None:
@@ -1973,6 +2060,36 @@ async def test_code_action_exec_output_nests_inside_code_action_box() -> None:
         assert len(root_exec_boxes) == 0
 
 
+@pytest.mark.asyncio
+async def test_exec_output_chunks_are_written_to_log_in_one_batch() -> None:
+    permission_manager = StubPermissionManager(preapproved=True)
+
+    async def scenario(_: PromptContent) -> AsyncIterator[AgentEvent]:
+        request = ApprovalRequest(
+            tool_call=CodeAction(tool_name="ipybox_execute_ipython_cell", code="print('hello')"),
+            agent_id=MAIN_AGENT_ID,
+            corr_id="code-1",
+        )
+        yield request
+        if await request.approved():
+            for i in range(3):
+                yield CodeExecutionOutputChunk(text=f"line {i}\n", agent_id=MAIN_AGENT_ID, corr_id="code-1")
+
+    app = _create_app(
+        agent_stream=MockStreamAgent(scenario).stream,
+        agent_id=MAIN_AGENT_ID,
+        permission_manager=permission_manager,  # type: ignore[arg-type]
+    )
+
+    async with app.run_test() as pilot:
+        await _submit_prompt(app, pilot)
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        exec_log = app.query(".exec-output-box").last().query_one(RichLog)
+        assert [line.text for line in exec_log.lines] == ["line 0", "line 1", "line 2", ""]
+
+
 @pytest.mark.asyncio
 async def test_shell_sub_approval_nests_inside_code_action_box() -> None:
     class CodeOnlyPermissionManager(StubPermissionManager):
@@ -1,5 +1,8 @@
 import subprocess
 
+import pytest
+
+from freeact.terminal import clipboard
 from freeact.terminal.clipboard import ClipboardAdapter
 
 
@@ -113,3 +116,53 @@ def test_paste_preserves_empty_clipboard_string() -> None:
     adapter = ClipboardAdapter(system_name="Darwin", run_command=run_command)
 
     assert adapter.paste() == ""
+
+
+def test_linux_copy_tries_last_working_backend_first() -> None:
+    calls: list[tuple[str, ...]] = []
+
+    def run_command(
+        command: tuple[str, ...], input_text: str | None, timeout: float
+    ) -> subprocess.CompletedProcess[str] | None:
+        del timeout, input_text
+        calls.append(command)
+        match command:
+            case ("xsel", "--clipboard", "--input"):
+                return subprocess.CompletedProcess(args=command, returncode=0, stdout="", stderr="")
+            case _:
+                return None
+
+    adapter = ClipboardAdapter(
+        system_name="Linux",
+        env={"XDG_SESSION_TYPE": "x11"},
+        run_command=run_command,
+    )
+
+    assert adapter.copy("first")
+    calls.clear()
+
+    assert adapter.copy("second")
+    assert calls == [("xsel", "--clipboard", "--input")]
+
+
+def test_default_run_command_skips_missing_binary(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_run(*args: object, **kwargs: object) -> None:
+        raise AssertionError("subprocess.run must not be called for a missing binary")
+
+    lookups: list[str] = []
+
+    def which(name: str) -> None:
+        lookups.append(name)
+        return None
+
+    clipboard._is_available.cache_clear()
+    monkeypatch.setattr(clipboard.shutil, "which", which)
+    monkeypatch.setattr(clipboard.subprocess, "run", fail_run)
+
+    try:
+        assert clipboard._default_run_command(("wl-copy",), "hello", 0.75) is None
+        assert clipboard._default_run_command(("wl-copy",), "again", 0.75) is None
+    finally:
+        clipboard._is_available.cache_clear()
+
+    assert lookups == ["wl-copy"]
@@ -79,6 +79,26 @@ async def test_init_loads_existing_file_without_overwrite(tmp_path: Path) -> Non
     assert persisted["expand_all_toggle_key"] == "ctrl+p"
 
 
+@pytest.mark.asyncio
+async def test_init_does_not_overwrite_file_when_validation_raises_file_not_found(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    freeact_dir = tmp_path / ".freeact"
+    freeact_dir.mkdir(parents=True)
+    config_path = freeact_dir / "terminal.json"
+    config_path.write_text(json.dumps({"expand_all_toggle_key": "ctrl+p"}))
+
+    def raise_file_not_found(cls: type[TerminalConfig], data: object) -> TerminalConfig:
+        raise FileNotFoundError("referenced file")
+
+    monkeypatch.setattr(TerminalConfig, "model_validate", classmethod(raise_file_not_found))
+
+    with pytest.raises(FileNotFoundError):
+        await TerminalConfig.init(working_dir=tmp_path)
+
+    assert json.loads(config_path.read_text()) == {"expand_all_toggle_key": "ctrl+p"}
+
+
 @pytest.mark.asyncio
 async def test_load_rejects_kebab_case_schema(tmp_path: Path) -> None:
     freeact_dir = tmp_path / ".freeact"
@@ -1,8 +1,9 @@
 import asyncio
 import json
+import time
 import uuid
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 from unittest.mock import MagicMock, patch
 
 import ipybox
@@ -127,6 +128,75 @@ class _FakeMcpServer:
         return self._result
 
 
+class _LifecycleMcpServer:
+    """MCP server stub that records its lifecycle events."""
+
+    def __init__(self, name: str, events: list[str]) -> None:
+        self.name = name
+        self.tool_prefix = name
+        self._events = events
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self._events.append(f"stopped:{self.name}")
+
+
+class TestMcpToolListing:
+    @pytest.mark.asyncio
+    async def test_failed_listing_cancels_other_listings_before_stop(self) -> None:
+        events: list[str] = []
+        servers = {name: _LifecycleMcpServer(name, events) for name in ("slow", "broken")}
+
+        async def get_tool_definitions(server: _LifecycleMcpServer) -> list[Any]:
+            if server.name == "broken":
+                raise RuntimeError("listing failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                events.append(f"cancelled:{server.name}")
+                raise
+            return []
+
+        with patch("freeact.agent.core.ipybox.CodeExecutor") as mock_executor:
+            mock_executor.return_value = MagicMock()
+            agent = Agent(config=create_test_config())
+
+        with (
+            patch.object(agent, "_create_mcp_servers", return_value=servers),
+            patch("freeact.agent.core.get_tool_definitions", get_tool_definitions),
+            pytest.raises(RuntimeError, match="listing failed") as exc_info,
+        ):
+            await agent.start()
+
+        assert exc_info.value.__suppress_context__
+        assert events[0] == "cancelled:slow"
+        assert sorted(events[1:]) == ["stopped:broken", "stopped:slow"]
+
+    @pytest.mark.asyncio
+    async def test_additional_listing_errors_are_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        events: list[str] = []
+        servers = {name: _LifecycleMcpServer(name, events) for name in ("first", "second")}
+
+        async def get_tool_definitions(server: _LifecycleMcpServer) -> list[Any]:
+            raise RuntimeError(f"{server.name} listing failed")
+
+        with patch("freeact.agent.core.ipybox.CodeExecutor") as mock_executor:
+            mock_executor.return_value = MagicMock()
+            agent = Agent(config=create_test_config())
+
+        with (
+            patch.object(agent, "_create_mcp_servers", return_value=servers),
+            patch("freeact.agent.core.get_tool_definitions", get_tool_definitions),
+            pytest.raises(RuntimeError, match="first listing failed"),
+        ):
+            await agent.start()
+
+        assert "Failed to list MCP server tools" in caplog.text
+        assert "second listing failed" in caplog.text
+
+
 class TestMcpToolCall:
     @pytest.mark.asyncio
     async def test_call_mcp_tool_returns_result_directly(self) -> None:
@@ -208,6 +278,97 @@ class TestSessionPersistenceConfig:
                 Agent(config=create_test_config(enable_persistence=False), session_id="session-1")
 
 
+class _StubSessionStore:
+    """Session store stub with delayed or failing appends."""
+
+    def __init__(self, append_delay: float = 0.0, fail_appends: int = 0) -> None:
+        self.messages: list[Any] = []
+        self._append_delay = append_delay
+        self._fail_appends = fail_appends
+
+    def append_messages(self, agent_id: str, messages: list[Any]) -> None:
+        time.sleep(self._append_delay)
+        if self._fail_appends > 0:
+            self._fail_appends -= 1
+            raise OSError("disk full")
+        self.messages.extend(messages)
+
+    def delete_last_messages(self, agent_id: str, count: int) -> None:
+        del self.messages[-count:]
+
+
+async def _text_stream_function(messages: Any, info: Any) -> Any:
+    yield "Done"
+
+
+async def _failing_stream_function(messages: Any, info: Any) -> Any:
+    raise RuntimeError("model failed")
+    yield  # make this an async generator
+
+
+class TestMessageHistoryPersistence:
+    """Tests for the background write of the turn's user request."""
+
+    @pytest.mark.asyncio
+    async def test_writes_stay_ordered_across_turns(self):
+        store = _StubSessionStore(append_delay=0.05)
+
+        async with patched_agent(_text_stream_function) as agent:
+            agent._session_store = store  # type: ignore[assignment]
+            await collect_stream(agent, "first")
+            await collect_stream(agent, "second")
+
+        assert len(agent._message_history) == 4
+        assert store.messages == agent._message_history
+
+    @pytest.mark.asyncio
+    async def test_rollback_waits_for_in_flight_write(self):
+        store = _StubSessionStore(append_delay=0.1)
+
+        async with patched_agent(_failing_stream_function) as agent:
+            agent._session_store = store  # type: ignore[assignment]
+            with pytest.raises(RuntimeError, match="model failed"):
+                await collect_stream(agent, "test")
+
+            assert agent._message_history == []
+            assert store.messages == []
+
+    @pytest.mark.asyncio
+    async def test_failed_background_write_during_turn_error_is_logged_as_persist_failure(self, caplog):
+        store = _StubSessionStore(append_delay=0.05, fail_appends=1)
+
+        async with patched_agent(_failing_stream_function) as agent:
+            agent._session_store = store  # type: ignore[assignment]
+            with pytest.raises(RuntimeError, match="model failed"):
+                await collect_stream(agent, "test")
+
+            assert agent._message_history == []
+            assert store.messages == []
+
+        assert "Failed to persist message history" in caplog.text
+        assert "Failed to rollback message history" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_failed_background_write_is_raised_and_keeps_earlier_history(self):
+        store = _StubSessionStore()
+
+        async with patched_agent(_text_stream_function) as agent:
+            agent._session_store = store  # type: ignore[assignment]
+            await collect_stream(agent, "kept")
+
+            store._fail_appends = 1
+            with pytest.raises(OSError, match="disk full"):
+                await collect_stream(agent, "lost")
+
+            assert len(agent._message_history) == 2
+            assert store.messages == agent._message_history
+
+            await collect_stream(agent, "next")
+
+        assert len(agent._message_history) == 4
+        assert store.messages == agent._message_history
+
+
 class TestIpyboxExecution:
     """Tests for ipybox_execute_ipython_cell tool with mocked code executor."""
 
@@ -289,6 +289,36 @@ def test_project_skills_are_loaded(tmp_path: Path) -> None:
     assert "my-skill" in names
 
 
+def test_edited_project_skill_is_reparsed(tmp_path: Path) -> None:
+    config = Config(working_dir=tmp_path)
+    skill_dir = config.project_skills_dir / "my-skill"
+    skill_dir.mkdir(parents=True)
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text("---\nname: my-skill\ndescription: Old description\n---\n")
+    assert config.skills_metadata[0].description == "Old description"
+
+    skill_file.write_text("---\nname: my-skill\ndescription: New, longer description\n---\n")
+
+    assert config.skills_metadata[0].description == "New, longer description"
+
+
+def test_replaced_project_skill_with_preserved_mtime_is_reparsed(tmp_path: Path) -> None:
+    config = Config(working_dir=tmp_path)
+    skill_dir = config.project_skills_dir / "my-skill"
+    skill_dir.mkdir(parents=True)
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text("---\nname: my-skill\ndescription: Old description\n---\n")
+    assert config.skills_metadata[0].description == "Old description"
+
+    replacement = tmp_path / "SKILL.md"
+    replacement.write_text("---\nname: my-skill\ndescription: New description\n---\n")
+    stat = skill_file.stat()
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    replacement.replace(skill_file)
+
+    assert config.skills_metadata[0].description == "New description"
+
+
 def test_system_prompt_renders_project_instructions(tmp_path: Path) -> None:
     config = Config(working_dir=tmp_path)
     config.project_instructions_file.write_text("Use pytest")
@@ -366,6 +396,41 @@ def test_provider_settings_missing_env_raises(monkeypatch: pytest.MonkeyPatch, t
         )
 
 
+def test_anthropic_model_settings_enable_prompt_caching(tmp_path: Path) -> None:
+    config = Config(
+        working_dir=tmp_path,
+        model="anthropic:claude-sonnet-4-6",
+        model_settings={"anthropic_cache_instructions": False},
+    )
+
+    assert config.model_settings == {"anthropic_cache_instructions": False}
+    assert config.resolved_model_settings == {
+        "anthropic_cache_tool_definitions": True,
+        "anthropic_cache_instructions": False,
+        "anthropic_cache_messages": True,
+    }
+
+
+def test_anthropic_automatic_caching_replaces_message_caching(tmp_path: Path) -> None:
+    config = Config(
+        working_dir=tmp_path,
+        model="anthropic:claude-sonnet-4-6",
+        model_settings={"anthropic_cache": True},
+    )
+
+    assert config.resolved_model_settings == {
+        "anthropic_cache_tool_definitions": True,
+        "anthropic_cache_instructions": True,
+        "anthropic_cache": True,
+    }
+
+
+def test_non_anthropic_model_settings_are_unchanged(tmp_path: Path) -> None:
+    config = Config(working_dir=tmp_path, model="openai:gpt-4o", model_settings={"temperature": 0.2})
+
+    assert config.resolved_model_settings == {"temperature": 0.2}
+
+
 def test_kernel_env_runtime_defaults_and_overrides(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     monkeypatch.setenv("HOME", "/home/test")
     monkeypatch.setenv("CUSTOM_VAR", "value")
@@ -393,6 +458,25 @@ def test_for_subagent_disables_subagents_and_sync_watch(tmp_path: Path) -> None:
         assert pytools_env["PYTOOLS_WATCH"] == "false"
 
 
+def test_for_subagent_does_not_share_mutable_settings(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("MY_API_KEY", "secret")
+    config = Config(
+        working_dir=tmp_path,
+        model="openai:gpt-4o",
+        model_settings={"temperature": 0.2},
+        provider_settings={"api_key": "${MY_API_KEY}"},
+        kernel_env={"CUSTOM": "value"},
+    )
+    subagent = config.for_subagent()
+
+    assert subagent.provider_settings == config.provider_settings
+    assert subagent.provider_settings is not config.provider_settings
+    assert subagent.model_settings is not config.model_settings
+    assert subagent.kernel_env is not config.kernel_env
+    assert subagent.mcp_servers is not config.mcp_servers
+    assert subagent.ptc_servers is not config.ptc_servers
+
+
 def test_freeact_dir_is_derived_from_working_dir(tmp_path: Path) -> None:
     config = Config(working_dir=tmp_path)
 